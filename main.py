@@ -1,19 +1,18 @@
 # main.py
 
+import os
+
 from utils.file_handler import (
     read_sales_data,
     parse_transactions,
     validate_and_filter
 )
 
-from utils.data_processor import (
-    calculate_total_revenue,
-    region_wise_sales,
-    top_selling_products,
-    customer_analysis,
-    daily_sales_trend,
-    find_peak_sales_day,
-    low_performing_products
+from utils.cache_manager import (
+    AnalyticsCache,
+    data_fingerprint,
+    normalize_filters,
+    run_analytics
 )
 
 from utils.api_handler import (
@@ -26,12 +25,33 @@ from utils.api_handler import (
 from utils.report_generator import generate_sales_report
 
 
+# On-disk result cache shared across runs (size-capped).
+# Override the location with SALES_CACHE_DIR, or set it to "" to disable.
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+
+
+def create_cache():
+    """
+    Creates the analytics cache, falling back to memory-only
+    if the disk cache is disabled or its directory is unusable.
+    """
+    cache_dir = os.environ.get("SALES_CACHE_DIR", DEFAULT_CACHE_DIR) or None
+
+    try:
+        return AnalyticsCache(cache_dir=cache_dir)
+    except OSError as e:
+        print(f"[WARNING] Disk cache unavailable, using memory only: {e}")
+        return AnalyticsCache()
+
+
 def main():
     """
     Main execution function as per assignment workflow
     """
 
     try:
+        cache = create_cache()
+
         print("=" * 40)
         print("SALES ANALYTICS SYSTEM")
         print("=" * 40)
@@ -40,6 +60,7 @@ def main():
         print("\n[1/10] Reading sales data...")
         file_path = "sales_data.txt"
         raw_data = read_sales_data(file_path)
+        fingerprint = data_fingerprint(raw_data)
         print(f"✓ Successfully read {len(raw_data)} lines")
 
         # ---------------- STEP 2 ----------------
@@ -66,6 +87,8 @@ def main():
 
         # ---------------- STEP 4 ----------------
         print("\n[4/10] Validating transactions...")
+        filters = normalize_filters(region, min_amount, max_amount)
+        region, min_amount, max_amount = filters
         valid_data, invalid_count, summary = validate_and_filter(
             transactions,
             region=region,
@@ -77,13 +100,7 @@ def main():
 
         # ---------------- STEP 5 ----------------
         print("\n[5/10] Analyzing sales data...")
-        total_revenue = calculate_total_revenue(valid_data)
-        region_stats = region_wise_sales(valid_data)
-        top_products = top_selling_products(valid_data)
-        top_customers = customer_analysis(valid_data)
-        daily_trends = daily_sales_trend(valid_data)
-        peak_day = find_peak_sales_day(valid_data)
-        low_products = low_performing_products(valid_data)
+        analytics = run_analytics(valid_data, cache, fingerprint, filters)
         print("✓ Analysis complete")
 
         # ---------------- STEP 6 ----------------
@@ -108,11 +125,13 @@ def main():
 
         # ---------------- STEP 9 ----------------
         print("\n[9/10] Generating report...")
-        generate_sales_report(valid_data, enriched_data)
+        generate_sales_report(valid_data, enriched_data, analytics=analytics)
         print("✓ Report saved to: output/sales_report.txt")
 
         # ---------------- STEP 10 ----------------
         print("\n[10/10] Process Complete!")
+        stats = cache.stats
+        print(f"Cache: {stats['hits']} hits ({stats['disk_hits']} from disk) | {stats['misses']} misses")
         print("=" * 40)
 
     except Exception as e:
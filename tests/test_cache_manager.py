@@ -0,0 +1,200 @@
+import os
+import pickle
+
+from utils.cache_manager import (
+    AnalyticsCache,
+    data_fingerprint,
+    normalize_filters,
+    run_analytics
+)
+from utils.file_handler import read_sales_data, parse_transactions, validate_and_filter
+from utils.report_generator import generate_sales_report
+
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "sales_data.txt")
+
+
+def make_counter(calls):
+    def total(values):
+        calls.append(values)
+        return sum(values)
+    return total
+
+
+def cache_files(cache_dir):
+    return [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)]
+
+
+def load_valid_data(region=None, min_amount=None):
+    raw_data = read_sales_data(DATA_FILE)
+    filters = normalize_filters(region, min_amount, None)
+    valid_data, _, _ = validate_and_filter(
+        parse_transactions(raw_data),
+        region=filters[0],
+        min_amount=filters[1],
+        max_amount=filters[2]
+    )
+    return valid_data, data_fingerprint(raw_data), filters
+
+
+def test_lru_hit_and_eviction_order():
+    cache = AnalyticsCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.get("a") == (True, 1)  # "a" becomes most recent
+    cache.put("c", 3)                   # evicts "b"
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+    assert cache.stats == {"hits": 3, "disk_hits": 0, "misses": 1}
+
+
+def test_hits_return_independent_copies():
+    cache = AnalyticsCache()
+    cache.put("key", {"items": [1]})
+
+    _, first = cache.get("key")
+    first["items"].append(2)
+
+    assert cache.get("key") == (True, {"items": [1]})
+
+
+def test_disk_round_trip_across_instances(tmp_path):
+    writer = AnalyticsCache(cache_dir=str(tmp_path))
+    writer.put("key", {"revenue": 1234.5})
+
+    reader = AnalyticsCache(cache_dir=str(tmp_path))
+    assert reader.get("key") == (True, {"revenue": 1234.5})
+    assert reader.stats == {"hits": 1, "disk_hits": 1, "misses": 0}
+
+    # Second lookup is served from memory
+    reader.get("key")
+    assert reader.stats == {"hits": 2, "disk_hits": 1, "misses": 0}
+
+
+def test_disk_size_cap_evicts_oldest(tmp_path):
+    cache = AnalyticsCache(cache_dir=str(tmp_path), max_disk_bytes=10**6)
+    cache.put("old", "x" * 1000)
+    (old_path,) = cache_files(str(tmp_path))
+    os.utime(old_path, (0, 0))
+
+    cache.max_disk_bytes = 1500
+    cache.put("new", "y" * 1000)
+
+    assert not os.path.exists(old_path)
+    assert len(cache_files(str(tmp_path))) == 1
+    assert AnalyticsCache(cache_dir=str(tmp_path)).get("new") == (True, "y" * 1000)
+
+
+def test_stale_temp_files_are_swept(tmp_path):
+    stale = tmp_path / "leftover.tmp"
+    stale.write_bytes(b"x" * 100)
+    os.utime(stale, (0, 0))
+
+    AnalyticsCache(cache_dir=str(tmp_path)).put("key", 1)
+
+    assert not stale.exists()
+
+
+def test_changed_data_fingerprint_misses():
+    cache = AnalyticsCache()
+    calls = []
+
+    fp1 = data_fingerprint(["T001|2024-12-01|P101|Laptop|2|45000|C001|North"])
+    fp2 = data_fingerprint(["T001|2024-12-01|P101|Laptop|3|45000|C001|North"])
+
+    total = make_counter(calls)
+
+    cache.memoize(fp1, None, total, [1, 2])
+    cache.memoize(fp1, None, total, [1, 2])
+    assert len(calls) == 1
+
+    cache.memoize(fp2, None, total, [1, 2])
+    assert len(calls) == 2
+
+
+def test_equivalent_filters_share_entry():
+    assert normalize_filters("North", 500, None) == normalize_filters(" North ", 500.0, None)
+
+    cache = AnalyticsCache()
+    calls = []
+    total = make_counter(calls)
+    cache.memoize("fp", normalize_filters(None, 500), total, [1])
+    cache.memoize("fp", normalize_filters(None, 500.0), total, [1])
+
+    assert len(calls) == 1
+
+
+def test_nan_filter_is_not_cached(tmp_path):
+    cache = AnalyticsCache(cache_dir=str(tmp_path))
+    calls = []
+    total = make_counter(calls)
+
+    filters = normalize_filters(None, float("nan"))
+    cache.memoize("fp", filters, total, [1])
+    cache.memoize("fp", filters, total, [1])
+
+    assert len(calls) == 2
+    assert cache_files(str(tmp_path)) == []
+
+
+def test_unhashable_argument_bypasses_cache():
+    cache = AnalyticsCache()
+
+    assert cache.memoize("fp", None, lambda data, extra: sum(extra), None, [1, 2]) == 3
+    assert cache.memoize("fp", None, lambda data, extra: sum(extra), None, [5, 5]) == 10
+    assert cache.stats["misses"] == 0
+
+
+def test_corrupt_disk_entry_is_a_miss(tmp_path):
+    AnalyticsCache(cache_dir=str(tmp_path)).put("key", 42)
+    (path,) = cache_files(str(tmp_path))
+
+    with open(path, "wb") as file:
+        file.write(pickle.dumps(1))
+
+    fresh = AnalyticsCache(cache_dir=str(tmp_path))
+    assert fresh.get("key") == (False, None)
+    assert not os.path.exists(path)
+
+
+def test_unpicklable_value_is_not_cached(tmp_path):
+    cache = AnalyticsCache(cache_dir=str(tmp_path))
+    cache.put("key", lambda: None)
+
+    assert cache.get("key") == (False, None)
+    assert os.listdir(tmp_path) == []
+
+
+def test_run_analytics_cached_matches_uncached(tmp_path):
+    valid_data, fingerprint, filters = load_valid_data("North", 500)
+    expected = run_analytics(valid_data)
+
+    run_analytics(valid_data, AnalyticsCache(cache_dir=str(tmp_path)), fingerprint, filters)
+
+    cache = AnalyticsCache(cache_dir=str(tmp_path))
+    cached = run_analytics(valid_data, cache, fingerprint, filters)
+
+    assert cached == expected
+    assert cache.stats == {"hits": 1, "disk_hits": 1, "misses": 0}
+
+
+def test_report_matches_with_cached_analytics(tmp_path):
+    valid_data, fingerprint, filters = load_valid_data()
+    cache = AnalyticsCache()
+    run_analytics(valid_data, cache, fingerprint, filters)
+    analytics = run_analytics(valid_data, cache, fingerprint, filters)
+    assert cache.stats["hits"] == 1
+
+    plain_file = str(tmp_path / "plain" / "report.txt")
+    cached_file = str(tmp_path / "cached" / "report.txt")
+    generate_sales_report(valid_data, valid_data, output_file=plain_file)
+    generate_sales_report(valid_data, valid_data, output_file=cached_file, analytics=analytics)
+
+    def body(path):
+        with open(path, encoding="utf-8") as file:
+            return [line for line in file if not line.startswith("Generated:")]
+
+    assert body(cached_file) == body(plain_file)
@@ -0,0 +1,330 @@
+# utils/cache_manager.py
+import hashlib
+import math
+import os
+import pickle
+import tempfile
+import time
+from collections import OrderedDict
+
+import utils.data_processor
+import utils.file_handler
+
+from utils.data_processor import (
+    calculate_total_revenue,
+    region_wise_sales,
+    top_selling_products,
+    customer_analysis,
+    daily_sales_trend,
+    find_peak_sales_day,
+    low_performing_products
+)
+
+
+# Bump to invalidate every cached entry regardless of source changes
+CACHE_VERSION = 1
+
+_code_version = None
+
+
+def code_version():
+    """
+    Returns a digest of CACHE_VERSION and the source of the modules whose
+    output is cached, so editing parsing or analytics code invalidates
+    results stored on disk by earlier versions.
+    """
+    global _code_version
+
+    if _code_version is None:
+        digest = hashlib.sha256(str(CACHE_VERSION).encode("utf-8"))
+
+        for module in (utils.file_handler, utils.data_processor):
+            with open(module.__file__, "rb") as file:
+                digest.update(file.read())
+
+        _code_version = digest.hexdigest()
+
+    return _code_version
+
+
+def data_fingerprint(raw_lines):
+    """
+    Returns SHA-256 hex digest of the raw data lines.
+    Hashing the lines that are parsed (rather than re-reading the file)
+    keeps the fingerprint consistent with the cached results.
+    """
+    digest = hashlib.sha256()
+
+    for line in raw_lines:
+        digest.update(line.encode("utf-8"))
+        digest.update(b"\n")
+
+    return digest.hexdigest()
+
+
+def _is_key_safe(value):
+    """
+    Checks that a value can be part of a cache key: scalars, or
+    tuples of scalars, whose repr is stable across runs.
+    NaN and infinite floats never compare equal reliably, so they
+    make the key uncacheable.
+    """
+    if isinstance(value, tuple):
+        return all(_is_key_safe(v) for v in value)
+
+    if isinstance(value, float):
+        return math.isfinite(value)
+
+    return isinstance(value, (str, int, bool, type(None)))
+
+
+def normalize_filters(region=None, min_amount=None, max_amount=None):
+    """
+    Normalizes filter parameters into a hashable tuple so that
+    equivalent filters (e.g. 500 and 500.0) share a cache entry.
+    """
+    region = region.strip() if region else None
+    min_amount = float(min_amount) if min_amount is not None else None
+    max_amount = float(max_amount) if max_amount is not None else None
+
+    return (region or None, min_amount, max_amount)
+
+
+class AnalyticsCache:
+    """
+    Two-level result cache: in-process LRU plus optional on-disk store.
+    Values are held as pickled bytes, so every hit returns a fresh copy
+    without deep-copying. Intended for small results (analytics, summaries),
+    not per-row transaction lists.
+    Disk entries are evicted least-recently-used first once the
+    directory grows beyond max_disk_bytes.
+    """
+
+    # Temp files older than this are leftovers from crashed writers
+    STALE_TMP_SECONDS = 3600
+
+    def __init__(self, max_entries=128, cache_dir=None, max_disk_bytes=50 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _disk_path(self, key):
+        name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.pkl")
+
+    def _remember(self, key, payload):
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key):
+        """
+        Returns (payload_bytes, value) for key, or None on miss.
+        """
+        path = self._disk_path(key)
+
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as file:
+                stored_key, payload = pickle.load(file)
+            if stored_key != key:
+                raise ValueError("cache key mismatch")
+            value = pickle.loads(payload)
+        except Exception:
+            # Corrupt or outdated entry: drop it and recompute
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        # Refresh access time so eviction stays least-recently-used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return payload, value
+
+    def _write_disk(self, key, payload):
+        path = self._disk_path(key)
+        tmp_path = None
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump((key, payload), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARNING] Could not write cache entry: {e}")
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            return
+
+        self._evict_disk()
+
+    def _evict_disk(self):
+        entries = []
+        total_size = 0
+        now = time.time()
+
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+
+        for name in names:
+            path = os.path.join(self.cache_dir, name)
+            try:
+                info = os.stat(path)
+            except OSError:
+                continue
+
+            if name.endswith(".tmp"):
+                # Only sweep temp files no live writer can still own
+                if now - info.st_mtime > self.STALE_TMP_SECONDS:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                else:
+                    total_size += info.st_size
+                continue
+
+            if not name.endswith(".pkl"):
+                continue
+
+            entries.append((info.st_mtime, info.st_size, path))
+            total_size += info.st_size
+
+        # Oldest entries go first
+        entries.sort()
+
+        for _, size, path in entries:
+            if total_size <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                continue
+
+    def get(self, key):
+        """
+        Looks up a key in memory, then on disk.
+        Returns: (found, value)
+        """
+        payload = self._memory.get(key)
+
+        if payload is not None:
+            self._memory.move_to_end(key)
+            self.stats["hits"] += 1
+            return True, pickle.loads(payload)
+
+        if self.cache_dir:
+            entry = self._read_disk(key)
+            if entry is not None:
+                payload, value = entry
+                self._remember(key, payload)
+                self.stats["hits"] += 1
+                self.stats["disk_hits"] += 1
+                return True, value
+
+        self.stats["misses"] += 1
+        return False, None
+
+    def put(self, key, value):
+        """
+        Stores a value in memory and, if enabled, on disk.
+        Values that cannot be pickled are not cached.
+        """
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"[WARNING] Could not cache value: {e}")
+            return
+
+        self._remember(key, payload)
+
+        if self.cache_dir:
+            self._write_disk(key, payload)
+
+    def clear(self):
+        """
+        Removes all memory and disk entries (including temp files)
+        and resets counters.
+        """
+        self._memory.clear()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+        if self.cache_dir:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith((".pkl", ".tmp")):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        pass
+
+    def memoize(self, fingerprint, filters, func, data, *args, **kwargs):
+        """
+        Calls func(data, *args, **kwargs) unless a result is cached for the
+        same code version, dataset fingerprint, filter set and parameters.
+        data itself is not hashed: the caller guarantees it is the dataset
+        identified by fingerprint and filters.
+        Caching is skipped if fingerprint is None or any other argument
+        is not a finite scalar (or tuple of them).
+        """
+        if fingerprint is None:
+            return func(data, *args, **kwargs)
+
+        params = (args, tuple(sorted(kwargs.items())))
+        if not _is_key_safe((fingerprint, filters, params)):
+            return func(data, *args, **kwargs)
+
+        key = (code_version(), fingerprint, func.__module__, func.__name__, filters, params)
+
+        found, value = self.get(key)
+        if found:
+            return value
+
+        value = func(data, *args, **kwargs)
+        self.put(key, value)
+        return value
+
+
+def _compute_analytics(transactions):
+    return {
+        "total_revenue": calculate_total_revenue(transactions),
+        "region_stats": region_wise_sales(transactions),
+        "top_products": top_selling_products(transactions, 5),
+        "customers": customer_analysis(transactions),
+        "daily_trends": daily_sales_trend(transactions),
+        "peak_day": find_peak_sales_day(transactions),
+        "low_products": low_performing_products(transactions, 10)
+    }
+
+
+def run_analytics(transactions, cache=None, fingerprint=None, filters=None):
+    """
+    Runs every data_processor analytic over the transactions,
+    reusing a cached result when a cache and fingerprint are given.
+    transactions must be the output of validate_and_filter for the
+    dataset fingerprint and normalized filters passed in.
+    Returns dictionary of results keyed by analytic name.
+    """
+    if cache is None:
+        return _compute_analytics(transactions)
+
+    return cache.memoize(fingerprint, filters, _compute_analytics, transactions)
@@ -12,9 +12,10 @@ from utils.data_processor import (
 )
 
 
-def generate_sales_report(transactions, enriched_transactions, output_file="output/sales_report.txt"):
+def generate_sales_report(transactions, enriched_transactions, output_file="output/sales_report.txt", analytics=None):
     """
     Generates a comprehensive formatted sales report
+    Reuses precomputed analytics (from run_analytics) when provided
     """
 
     # Ensure output directory exists
@@ -23,18 +24,29 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
 
     now = datetime.now()
     total_transactions = len(transactions)
-    total_revenue = calculate_total_revenue(transactions)
+    if analytics is None:
+        analytics = {
+            "total_revenue": calculate_total_revenue(transactions),
+            "region_stats": region_wise_sales(transactions),
+            "top_products": top_selling_products(transactions, 5),
+            "customers": customer_analysis(transactions),
+            "daily_trends": daily_sales_trend(transactions),
+            "peak_day": find_peak_sales_day(transactions),
+            "low_products": low_performing_products(transactions)
+        }
+
+    total_revenue = analytics["total_revenue"]
     avg_order_value = total_revenue / total_transactions if total_transactions else 0
 
     dates = sorted(t["Date"] for t in transactions)
     date_range = f"{dates[0]} to {dates[-1]}" if dates else "N/A"
 
-    region_stats = region_wise_sales(transactions)
-    top_products = top_selling_products(transactions, 5)
-    customers = customer_analysis(transactions)
-    daily_trends = daily_sales_trend(transactions)
-    peak_day = find_peak_sales_day(transactions)
-    low_products = low_performing_products(transactions)
+    region_stats = analytics["region_stats"]
+    top_products = analytics["top_products"]
+    customers = analytics["customers"]
+    daily_trends = analytics["daily_trends"]
+    peak_day = analytics["peak_day"]
+    low_products = analytics["low_products"]
 
     # API enrichment summary
     enriched_success = [t for t in enriched_transactions if t.get("API_Match")]